@@ -0,0 +1,9 @@
+# Augmenting declarations for optional Cython compilation of build_report.py
+# (python setup.py build_ext --inplace). The plain .py module works unchanged
+# when no compiled extension is present.
+
+# convert_markdown_to_html is deliberately not declared here: it carries an
+# lru_cache decorator, which Cython rejects on cpdef functions.
+cpdef dict split_markdown_by_sections(md_content)
+cpdef str process_inline_formatting(str text)
+cpdef str rewrite_image_path(str img_path)
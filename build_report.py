@@ -6,105 +6,58 @@ Modified from nbconvert repository.
 https://github.com/jupyter/nbconvert
 """
 
+import hashlib
+import html as html_module
+import io
+import json
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Optional C-backed markdown parser. When mistune is available one native
+# tokenizer pass replaces the pure-Python line scanner below; otherwise the
+# original converter is used unchanged. The renderer overrides below use
+# the mistune 3.x API (2.x swaps the link/image argument order, which would
+# corrupt output silently), so older versions fall back too.
+try:
+    import mistune
+    if not mistune.__version__.startswith('3.'):
+        mistune = None
+except ImportError:
+    mistune = None
+
+# Optional linear-time regex engine (pyre2 wraps Google's RE2). All of the
+# patterns below are RE2-compatible; stdlib re is the drop-in fallback.
+# Only pyre2 mirrors the re API — google-re2 also installs as 're2' but
+# lacks the flag constants, so probe the surface before trusting it.
+try:
+    import re2 as _regex_engine
+    if not (hasattr(_regex_engine, 'DOTALL') and hasattr(_regex_engine, 'MULTILINE')
+            and hasattr(_regex_engine, 'compile')):
+        _regex_engine = re
+except ImportError:
+    _regex_engine = re
+
+# Optional SIMD-accelerated JSON parser for the section config; stdlib json
+# is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration.
 
-SECTION_MAPPING = {
-    "1. INTRODUCTION": {
-        "page_file": "01_introduction.html",
-        "page_title": "INTRODUCTION",
-        "right_panel": """
-    <h2>Key Question</h2>
-    <p>How do environmental, socioeconomic, and urban morphology factors influence quality of life in NYC during extreme heat weeks versus normal heat weeks?</p>
-    
-    <h2>Hypotheses</h2>
-    <p>- QoL complaint rates rise with temperature.</p>
-    <p>- SHAP values can reveal the key drivers of 311 complaints.</p>
-    <p>- Different factors may become more important during extreme heat.</p>
-"""
-    },
-    "2. DATA and METHODS": {
-        "page_file": "02_data_and_methods.html",
-        "page_title": "DATA & METHODS",
-        "right_panel": """
-    <h2>Study Parameters</h2>
-    <b>Location:</b> New York City<br><br>
-    <b>Spatial Resolution:</b> Census tract level<br><br>
-    <b>Time Period:</b> Summer 2025 (June–August 23)<br><br>
-    <b>Temporal Resolution:</b> Weekly<br><br>
-    
-    <h2>Heat Thresholds</h2>
-    93°F is the extreme heat threshold based on 95th percentile of 1981–2010 climatological baseline.<br><br>
-    - 5 extreme heat weeks<br>
-    - 7 normal heat weeks<br><br>
-    
-    <h2>Data Sources</h2>
-    - NOAA (temperature)<br>
-    - ACS 2023 (socioeconomic)<br>
-    - Landsat (environmental / urban)<br>
-    - OpenStreetMap (POIs / kNN / urban)
-"""
-    },
-    "3. RESULTS": {
-        "page_file": "03_results.html",
-        "page_title": "RESULTS",
-        "right_panel": """
-    <h2>Model Performance</h2>
-    
-    <h3>OLS Models</h3>
-    <b>Normal Heat</b>
-    R²: 0.084<br><br>
-    <b>Extreme Heat</b>
-    R²: 0.088<br><br>
-    
-    <h3>Random Forest</h3>
-    <b>Normal Heat</b>
-    R²: 0.2738<br>
-    RMSE: 0.1940<br>
-    MAE: 0.1537<br><br>
-    <b>Extreme Heat</b>
-    R²: 0.2458<br>
-    RMSE: 0.4149<br>
-    MAE: 0.3129<br><br>
-    
-    <h2>Top SHAP Predictors</h2>
-    <ol>
-        <li>Average Height (AH)</li>
-        <li>PCT_NON_WHITE</li>
-        <li>NDVI</li>
-        <li>KNN_SUBWAY_dist_mean</li><br>
-    </ol>
-"""
-    },
-    "4. DISCUSSION": {
-        "page_file": "05_discussion.html",
-        "page_title": "DISCUSSION",
-        "right_panel": """
-    <h2>Key Insights</h2>
-    <p>Non-linear relationships are the rule rather than the exception for most urban features.</p>
-    
-    <h2>Notable Patterns</h2>
-    <b>AH:</b> U-shaped relationship.<br><br>
-    <b>PCT_NON_WHITE:</b> Inverted-U pattern.<br><br>
-    <b>NDVI:</b> Linear negative (more green = fewer complaints).<br><br>
-    <b>BD:</b> Changes from inverted-U to linear under extreme heat.<br><br>
-    
-    <h2>Limitations</h2>
-    <p>- Single summer season (2025).</p>
-    <p>- Approximately 25% variance explained suggests additional factors at play.</p>
-"""
-    },
-    "5. REFERENCES": {
-        "page_file": "06_references.html",
-        "page_title": "REFERENCES",
-        "right_panel": """
-    <h2>Citation Info</h2>
-    <p>All references follow APA 7th edition format.</p>
-"""
-    }
-}
+# Per-section page config (file name, title, static right panel) lives in
+# section_mapping.json so import skips parsing the big string literals.
+_mapping_bytes = Path(__file__).with_name('section_mapping.json').read_bytes()
+if orjson is not None:
+    SECTION_MAPPING = orjson.loads(_mapping_bytes)
+else:
+    SECTION_MAPPING = json.loads(_mapping_bytes)
+del _mapping_bytes
 
 # Image path configuration for GitHub Pages with SPA-style loading
 # Since app.js loads page fragments into index.html at the site root,
@@ -117,10 +70,106 @@ IMAGE_PATH_PREFIX = "images/"
 #   docs/images/EDA/...
 #   docs/pages/03_results.html (loaded via fetch into index.html)
 
+# Source and output locations, probed once at import so repeated main()
+# calls (e.g. from a rebuild-on-save watcher) skip the exists() syscalls.
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+REPORT_PATH = next(
+    (p for p in (_SCRIPT_DIR / 'Project_Report.md',
+                 _SCRIPT_DIR.parent / 'Project_Report.md') if p.exists()),
+    None)
+PAGES_DIR = next(
+    (p for p in (_SCRIPT_DIR / 'docs' / 'pages',
+                 _SCRIPT_DIR.parent / 'docs' / 'pages') if p.exists()),
+    _SCRIPT_DIR / 'pages')
+
+# Precompiled patterns, shared by all sections so nothing is recompiled
+# (or looked up in re's bounded cache) per call. Compiled with RE2 when
+# pyre2 is installed, stdlib re otherwise.
+_RE_FRONTMATTER = _regex_engine.compile(r'^---\n.*?---\n', _regex_engine.DOTALL)
+_RE_CODE_FENCE = _regex_engine.compile(r'```(\w*)\n(.*?)```', _regex_engine.DOTALL)
+_RE_INLINE_CODE = _regex_engine.compile(r'`([^`]+)`')
+_RE_CODE_PLACEHOLDER = _regex_engine.compile(r'^__CODE_BLOCK_(\d+)__$')
+_RE_INLINE_PLACEHOLDER = _regex_engine.compile(r'__INLINE_CODE_(\d+)__')
+_RE_IMAGE = _regex_engine.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+# Strips rendered tags out of image alt text in the mistune path.
+_RE_TAG = _regex_engine.compile(r'<[^>]+>')
+_RE_LIST_ITEM = _regex_engine.compile(r'^-\s+(.+)$')
+# All header levels in one pattern; the hash count picks the tag (h1 from
+# '# ' is dropped because the report uses it for section titles only).
+_RE_HEADER = _regex_engine.compile(r'^(#{1,4}) (.*)$')
+_HEADER_TAGS = {2: 'h1', 3: 'h2', 4: 'h3'}
+# Bold before italic so '**' wins over '*'. Both branches use negated
+# character classes instead of lazy quantifiers, so matching stays linear
+# even on pathological runs of asterisks.
+_RE_EMPH = _regex_engine.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*')
+_RE_ITALIC = _regex_engine.compile(r'\*([^*]+)\*')
+_RE_LINK = _regex_engine.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_H1_SECTION = _regex_engine.compile(r'^# (\d+\. .+)$', _regex_engine.MULTILINE)
+# Bytes twins of the document-level patterns, so frontmatter stripping and
+# section splitting can run on the mmap'd file without decoding it first.
+_RE_FRONTMATTER_B = _regex_engine.compile(rb'^---\n.*?---\n', _regex_engine.DOTALL)
+_RE_H1_SECTION_B = _regex_engine.compile(rb'^# (\d+\. .+)$', _regex_engine.MULTILINE)
+
 # Conversion functions.
+def rewrite_image_path(img_path):
+    """Rewrite a markdown image path to be relative to the site root."""
+    # Original markdown: notebooks/images/EDA/file.png
+    # Target: images/EDA/file.png (relative to site root for SPA)
+    if img_path.startswith('notebooks/images/'):
+        return IMAGE_PATH_PREFIX + img_path[len('notebooks/images/'):]
+    elif img_path.startswith('notebooks/'):
+        return IMAGE_PATH_PREFIX + img_path[len('notebooks/'):]
+    return img_path
+
+if mistune is not None:
+    class _ReportRenderer(mistune.HTMLRenderer):
+        """HTML renderer matching the output conventions of the fallback converter."""
+
+        def heading(self, text, level, **attrs):
+            # The report uses h1 for section titles only; shift markdown
+            # headers up one level and drop any stray h1 from the body.
+            if level == 1:
+                return ''
+            return f'<h{level - 1}>{text}</h{level - 1}>\n'
+
+        def link(self, text, url, title=None):
+            return f'<a href="{url}" target="_blank">{text}</a>'
+
+        def image(self, text, url, title=None):
+            img_path = rewrite_image_path(url)
+            # text arrives as rendered children (e.g. <em>…</em>); the
+            # caption keeps the markup but the alt attribute must not.
+            clean_alt = _RE_TAG.sub('', text)
+            return (f'<figure><img class="report-image" src="{img_path}" '
+                    f'alt="{clean_alt}"><figcaption>{text}</figcaption></figure>')
+
+        def paragraph(self, text):
+            # Images are inline in mistune, which would leave figures
+            # wrapped as <p><figure>…</figure></p> — invalid nesting the
+            # line-based converter never produced.
+            if text.startswith('<figure>') and text.endswith('</figure>'):
+                return text + '\n'
+            return f'<p>{text}</p>\n'
+
+    # Build the parser once at import; main reuses it for every section.
+    _MD = mistune.create_markdown(renderer=_ReportRenderer())
+else:
+    _MD = None
+
+@lru_cache(maxsize=32)
 def convert_markdown_to_html(md_text):
+    """Convert markdown to HTML, using mistune when available.
+
+    Pure function of its input, so repeated conversions of the same
+    section (e.g. from a rebuild-on-save watcher) hit the cache.
+    """
+    if _MD is not None:
+        return _MD(md_text)
+    return _convert_markdown_fallback(md_text)
+
+def _convert_markdown_fallback(md_text):
     """Convert markdown to HTML with proper nested list support."""
-    
+
     # First, protect and convert fenced code blocks
     code_blocks = []
     def save_code_block(match):
@@ -130,7 +179,7 @@ def convert_markdown_to_html(md_text):
         return f'__CODE_BLOCK_{len(code_blocks)-1}__'
     
     # Match fenced code blocks: ```language\ncode\n```
-    md_text = re.sub(r'```(\w*)\n(.*?)```', save_code_block, md_text, flags=re.DOTALL)
+    md_text = _RE_CODE_FENCE.sub(save_code_block, md_text)
     
     # Protect inline code
     inline_codes = []
@@ -138,73 +187,59 @@ def convert_markdown_to_html(md_text):
         inline_codes.append(match.group(1))
         return f'__INLINE_CODE_{len(inline_codes)-1}__'
     
-    md_text = re.sub(r'`([^`]+)`', save_inline_code, md_text)
+    md_text = _RE_INLINE_CODE.sub(save_inline_code, md_text)
     
-    # Process markdown line by line.
+    # Process markdown line by line, streaming output into one buffer
+    # instead of accumulating a list and joining.
     lines = md_text.split('\n')
-    html_lines = []
+    out = io.StringIO()
     
     i = 0
     while i < len(lines):
         line = lines[i]
         
         # Check for code block placeholder
-        code_block_match = re.match(r'^__CODE_BLOCK_(\d+)__$', line.strip())
+        code_block_match = _RE_CODE_PLACEHOLDER.match(line.strip())
         if code_block_match:
             idx = int(code_block_match.group(1))
             lang, code = code_blocks[idx]
             # Escape HTML in code
-            import html
-            escaped_code = html.escape(code)
+            escaped_code = html_module.escape(code)
             lang_class = f' class="language-{lang}"' if lang else ''
-            html_lines.append(f'<pre><code{lang_class}>{escaped_code}</code></pre>')
+            out.write(f'<pre><code{lang_class}>{escaped_code}</code></pre>\n')
             i += 1
             continue
         
         # Check for headers.
-        if line.startswith('#### '):
-            html_lines.append(f'<h3>{line[5:]}</h3>')
-            i += 1
-            continue
-        elif line.startswith('### '):
-            html_lines.append(f'<h2>{line[4:]}</h2>')
-            i += 1
-            continue
-        elif line.startswith('## '):
-            html_lines.append(f'<h1>{line[3:]}</h1>')
-            i += 1
-            continue
-        elif line.startswith('# '):
-            # Skip h1 headers.
+        header_match = _RE_HEADER.match(line)
+        if header_match:
+            tag = _HEADER_TAGS.get(len(header_match.group(1)))
+            if tag:
+                out.write(f'<{tag}>{header_match.group(2)}</{tag}>\n')
             i += 1
             continue
         
         # Check for image.
-        img_match = re.match(r'!\[([^\]]*)\]\(([^)]+)\)', line)
+        img_match = _RE_IMAGE.match(line)
         if img_match:
             alt_text = img_match.group(1)
             img_path = img_match.group(2)
             # Adjust path for website structure.
-            # Original markdown: notebooks/images/EDA/file.png
-            # Target: images/EDA/file.png (relative to site root for SPA)
-            if img_path.startswith('notebooks/images/'):
-                img_path = IMAGE_PATH_PREFIX + img_path[len('notebooks/images/'):]
-            elif img_path.startswith('notebooks/'):
-                img_path = IMAGE_PATH_PREFIX + img_path[len('notebooks/'):]
+            img_path = rewrite_image_path(img_path)
             # Process caption for italics.
             caption = process_inline_formatting(alt_text)
             # Clean alt text.
-            clean_alt = re.sub(r'\*([^*]+)\*', r'\1', alt_text)
-            html_lines.append(f'<figure><img class="report-image" src="{img_path}" alt="{clean_alt}"><figcaption>{caption}</figcaption></figure>')
+            clean_alt = _RE_ITALIC.sub(r'\1', alt_text)
+            out.write(f'<figure><img class="report-image" src="{img_path}" alt="{clean_alt}"><figcaption>{caption}</figcaption></figure>\n')
             i += 1
             continue
         
         # Check for list start.
-        list_match = re.match(r'^-\s+(.+)$', line)
+        list_match = _RE_LIST_ITEM.match(line)
         if list_match:
             # Collect list items.
             list_html, new_i = process_list(lines, i)
-            html_lines.append(list_html)
+            out.write(list_html + '\n')
             i = new_i
             continue
         
@@ -213,148 +248,161 @@ def convert_markdown_to_html(md_text):
         if stripped:
             # Process inline formatting.
             processed = process_inline_formatting(stripped)
-            html_lines.append(f'<p>{processed}</p>')
+            out.write(f'<p>{processed}</p>\n')
         
         i += 1
     
-    # Join and restore inline codes.
-    html = '\n'.join(html_lines)
-    
-    for idx, code in enumerate(inline_codes):
-        html = html.replace(f'__INLINE_CODE_{idx}__', f'<code>{code}</code>')
-    
+    # Drop the trailing newline and restore inline codes in one pass.
+    html = out.getvalue()[:-1]
+
+    if inline_codes:
+        html = _RE_INLINE_PLACEHOLDER.sub(
+            lambda m: f'<code>{inline_codes[int(m.group(1))]}</code>', html)
+
     return html
 
 def process_list(lines, start_idx):
-    """Process a list starting at start_idx, handling nested lists properly."""
-    html_parts = ['<ul>']
+    """Process a list starting at start_idx, handling nested lists properly.
+
+    Single pass with a stack of indent levels (4 spaces per level), so any
+    nesting depth works without look-ahead rescans.
+    """
+    parts = ['<ul>']
+    stack = [0]
     i = start_idx
-    
+
     while i < len(lines):
         line = lines[i]
-        
-        # Check for top-level list item.
-        top_match = re.match(r'^-\s+(.+)$', line)
-        if top_match:
-            content = process_inline_formatting(top_match.group(1))
-            
-            # Look ahead for nested items.
-            nested_items = []
-            j = i + 1
-            while j < len(lines):
-                nested_match = re.match(r'^    -\s+(.+)$', lines[j])
-                if nested_match:
-                    nested_items.append(process_inline_formatting(nested_match.group(1)))
-                    j += 1
-                else:
-                    break
-            
-            if nested_items:
-                # Item with nested list.
-                html_parts.append(f'<li>{content}')
-                html_parts.append('<ul>')
-                for nested in nested_items:
-                    html_parts.append(f'<li>{nested}</li>')
-                html_parts.append('</ul>')
-                html_parts.append('</li>')
-                i = j
-            else:
-                # Simple item.
-                html_parts.append(f'<li>{content}</li>')
-                i += 1
-            continue
-        
-        # Check if still in list.
+
         if line.strip() == '':
-            # Check if next line continues the list.
-            if i + 1 < len(lines) and re.match(r'^-\s+', lines[i + 1]):
+            # List continues across a blank line only if an item follows.
+            if i + 1 < len(lines) and _RE_LIST_ITEM.match(lines[i + 1]):
                 i += 1
                 continue
-            else:
-                # End of list.
-                break
-        elif re.match(r'^    -\s+', line):
-            # Orphan nested item.
-            i += 1
-            continue
-        else:
-            # End list.
             break
-    
-    html_parts.append('</ul>')
-    return '\n'.join(html_parts), i
+
+        indent = len(line) - len(line.lstrip(' '))
+        if indent % 4 != 0:
+            break
+        item_match = _RE_LIST_ITEM.match(line[indent:])
+        if not item_match:
+            break
+        level = indent // 4
+
+        # Close lists deeper than this item.
+        while level < stack[-1]:
+            parts.append('</ul>')
+            parts.append('</li>')
+            stack.pop()
+
+        if level > stack[-1]:
+            if parts[-1].endswith('</li>'):
+                # Reopen the previous item and nest a new list under it.
+                parts[-1] = parts[-1][:-5]
+                parts.append('<ul>')
+                stack.append(level)
+            else:
+                # Orphan nested item with no parent; drop it.
+                i += 1
+                continue
+
+        parts.append(f'<li>{process_inline_formatting(item_match.group(1))}</li>')
+        i += 1
+
+    # Close whatever is still open.
+    while stack[-1] > 0:
+        parts.append('</ul>')
+        parts.append('</li>')
+        stack.pop()
+
+    parts.append('</ul>')
+    return '\n'.join(parts), i
+
+def _emphasis_repl(match):
+    """Dispatch a fused bold/italic match to the right tag."""
+    bold, italic = match.group(1), match.group(2)
+    if bold is not None:
+        return f'<strong>{bold}</strong>'
+    return f'<em>{italic}</em>'
 
 def process_inline_formatting(text):
     """Process inline formatting: bold, italic, links."""
-    # Bold.
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    
-    # Italic.
-    text = re.sub(r'\*([^*]+)\*', r'<em>\1</em>', text)
-    
+    # Bold and italic in a single pass.
+    text = _RE_EMPH.sub(_emphasis_repl, text)
+
     # Links.
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" target="_blank">\1</a>', text)
+    text = _RE_LINK.sub(r'<a href="\2" target="_blank">\1</a>', text)
     
     return text
 
 def split_markdown_by_sections(md_content):
-    """Split markdown content by h1 headers."""
-    pattern = r'^# (\d+\. .+)$'
-    
-    sections = {}
-    current_section = None
-    current_content = []
-    
-    for line in md_content.split('\n'):
-        match = re.match(pattern, line)
-        if match:
-            if current_section:
-                sections[current_section] = '\n'.join(current_content)
-            current_section = match.group(1)
-            current_content = []
-        else:
-            current_content.append(line)
-    
-    if current_section:
-        sections[current_section] = '\n'.join(current_content)
-    
-    return sections
+    """Split markdown content by h1 headers. Accepts str or bytes.
 
-def generate_page_html(title, content_html, right_panel_html):
-    """Generate full page HTML fragment."""
-    return f'''<div class="content-middle">
+    For bytes input the section bodies stay undecoded; the names (plain
+    ASCII headers) are decoded for use as mapping keys.
+    """
+    # One native split instead of a Python loop over every line; parts
+    # alternate [preamble, name, body, name, body, ...].
+    if isinstance(md_content, bytes):
+        parts = _RE_H1_SECTION_B.split(md_content)
+        # List comprehension rather than a genexp: closures are not
+        # supported inside cpdef functions when compiled with Cython.
+        names = [name.decode('utf-8') for name in parts[1::2]]
+        return dict(zip(names, parts[2::2]))
+    parts = _RE_H1_SECTION.split(md_content)
+    return dict(zip(parts[1::2], parts[2::2]))
+
+def _page_parts(title, right_panel_html):
+    """Build the static prefix/suffix of a page around the report body."""
+    prefix = f'''<div class="content-middle">
     <h1>{title}</h1>
     <h2>Hot City, Heated Calls:<br>Understanding How Urban Features Affect Quality of Life Under Different Heat Conditions Using New York City's 311 and SHAP</h2>
     
     <div class="report-content">
-{content_html}
+'''
+    suffix = f'''
     </div>
 </div>
 
 <div class="content-right">
 {right_panel_html}
 </div>'''
+    return prefix, suffix
+
+def generate_page_html(title, content_html, right_panel_html):
+    """Generate full page HTML fragment."""
+    prefix, suffix = _page_parts(title, right_panel_html)
+    return prefix + content_html + suffix
+
+# Everything around the converted body is static per section, so build the
+# page wrapper halves once at import instead of re-interpolating per build.
+# They are stored UTF-8-encoded so writes skip the per-page encode pass.
+for _config in SECTION_MAPPING.values():
+    _prefix, _suffix = _page_parts(_config['page_title'], _config['right_panel'])
+    _config['page_parts'] = (_prefix.encode('utf-8'), _suffix.encode('utf-8'))
+del _config, _prefix, _suffix
+
+def _render_section(args):
+    """Render one section to its page file. Runs in a worker process."""
+    section_content, config, pages_dir = args
+
+    content_html = convert_markdown_to_html(section_content)
+    prefix, suffix = config['page_parts']
+
+    output_path = pages_dir / config['page_file']
+    output_path.write_bytes(prefix + content_html.encode('utf-8') + suffix)
+
+    return config['page_file'], output_path.stat().st_size / 1024
 
 # Main.
 
 def main():
-    script_dir = Path(__file__).parent.resolve()
-    
-    # Look for Project_Report.md.
-    report_path = script_dir / 'Project_Report.md'
-    if not report_path.exists():
-        report_path = script_dir.parent / 'Project_Report.md'
-    if not report_path.exists():
+    report_path = REPORT_PATH
+    if report_path is None:
         print(f"ERROR: Cannot find Project_Report.md")
         return
-    
-    # Look for docs/pages/.
-    pages_dir = script_dir / 'docs' / 'pages'
-    if not pages_dir.exists():
-        pages_dir = script_dir.parent / 'docs' / 'pages'
-    if not pages_dir.exists():
-        pages_dir = script_dir / 'pages'
-    
+
+    pages_dir = PAGES_DIR
     pages_dir.mkdir(parents=True, exist_ok=True)
     
     print("Building report pages from Project_Report.md.")
@@ -362,11 +410,19 @@ def main():
     print(f"Output: {pages_dir}")
     print()
     
-    # Read markdown.
-    md_content = report_path.read_text(encoding='utf-8')
+    # Read markdown through mmap and keep it as bytes: frontmatter
+    # stripping, section splitting and hashing all run on raw bytes, and
+    # only sections that need re-rendering are decoded.
+    with open(report_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mmap'd.
+            md_content = f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                md_content = mm[:]
     
     # Remove YAML frontmatter.
-    md_content = re.sub(r'^---\n.*?---\n', '', md_content, flags=re.DOTALL)
+    md_content = _RE_FRONTMATTER_B.sub(b'', md_content)
     
     # Split into sections.
     sections = split_markdown_by_sections(md_content)
@@ -376,24 +432,41 @@ def main():
         print(f"  - {section_name}")
     print()
     
-    # Generate pages.
+    # Load the digest cache from the previous build.
+    cache_path = pages_dir / '.build_cache.json'
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = {}
+
+    # Generate pages. Sections are independent (own file, own content),
+    # so render them in parallel worker processes. Sections whose markdown
+    # digest matches the previous build are skipped entirely.
+    tasks = []
+    new_cache = {}
     for section_name, section_content in sections.items():
-        if section_name in SECTION_MAPPING:
-            config = SECTION_MAPPING[section_name]
-            content_html = convert_markdown_to_html(section_content)
-            page_html = generate_page_html(
-                config['page_title'],
-                content_html,
-                config['right_panel']
-            )
-            
-            output_path = pages_dir / config['page_file']
-            output_path.write_text(page_html, encoding='utf-8')
-            
-            size_kb = output_path.stat().st_size / 1024
-            print(f"{config['page_file']} ({size_kb:.1f} KB).")
-        else:
+        if section_name not in SECTION_MAPPING:
             print(f"Skipping unmapped section: {section_name}.")
+            continue
+
+        config = SECTION_MAPPING[section_name]
+        # blake2b is noticeably faster than sha256 on short inputs.
+        digest = hashlib.blake2b(section_content, digest_size=16).hexdigest()
+        new_cache[config['page_file']] = digest
+
+        if cache.get(config['page_file']) == digest and (pages_dir / config['page_file']).exists():
+            print(f"{config['page_file']} (unchanged).")
+            continue
+
+        tasks.append((section_content.decode('utf-8'), config, pages_dir))
+
+    # Don't pay pool startup when the digest cache skipped everything.
+    if tasks:
+        with ProcessPoolExecutor() as executor:
+            for page_file, size_kb in executor.map(_render_section, tasks):
+                print(f"{page_file} ({size_kb:.1f} KB).")
+
+    cache_path.write_text(json.dumps(new_cache, indent=2), encoding='utf-8')
     
     print()
     print("Updated report.")
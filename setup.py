@@ -0,0 +1,17 @@
+"""
+Optional Cython build for build_report.py.
+
+Run `python setup.py build_ext --inplace` to compile the report builder
+with the type declarations from build_report.pxd. Without the compiled
+extension the pure-Python module runs as before, so Cython is never a
+hard requirement.
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+setup(
+    name='build-report',
+    ext_modules=cythonize(['build_report.py'], language_level=3),
+)